@@ -13,11 +13,84 @@ compatibility with geographic hierarchy navigation.
 """
 
 import os
+import functools
+import itertools
 import json
 import re
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing/serialization, stdlib json otherwise
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: index.msgpack is only written when available
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: index.json.zst is only written when available
+    zstandard = None
+
+
+# Release pagination settings. Pages after the first are fetched concurrently.
+RELEASES_PER_PAGE = 100
+PAGE_FETCH_WORKERS = 8
+
+# Releases processed concurrently in scan_releases (metadata/checksum downloads)
+RELEASE_PROCESS_WORKERS = 8
+
+# Rate limiting: pause until reset when this few requests remain, and retry
+# rate-limited (403/429) responses this many times with exponential backoff
+RATE_LIMIT_MIN_REMAINING = 2
+RATE_LIMIT_RETRIES = 3
+
+# Per-page REST responses and their ETags, reused via If-None-Match on later runs.
+# Only the REST path uses this (no token, or GraphQL failed).
+RELEASE_CACHE_DIR = os.environ.get("RELEASE_CACHE_DIR", ".release_cache")
+
+# Line-delimited copy of the regions map, written next to index.json
+REGIONS_NDJSON_PATH = "regions.ndjson"
+
+# MessagePack copy of the full index for clients that prefer a binary format
+INDEX_MSGPACK_PATH = "index.msgpack"
+
+# zstd-compressed copy of index.json (written next to it with a .zst suffix)
+INDEX_ZSTD_LEVEL = 19
+
+# GraphQL release query: only the fields scan_releases uses, newest first (matches REST order)
+GRAPHQL_URL = "https://api.github.com/graphql"
+RELEASE_ASSETS_PER_QUERY = 100
+RELEASES_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    releases(first: %d, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        tagName
+        publishedAt
+        url
+        description
+        releaseAssets(first: %d) {
+          pageInfo { hasNextPage }
+          nodes { name size downloadUrl }
+        }
+      }
+    }
+  }
+}
+""" % (RELEASES_PER_PAGE, RELEASE_ASSETS_PER_QUERY)
 
 
 # Mapping from release tag region names to geographic paths
@@ -98,7 +171,7 @@ EUROPE_COUNTRIES_TO_PATH = {
     "faroe-islands": "europe/faroe-islands",
     "finland": "europe/finland",
     "france": "europe/france",
-    "georgia": "europe/georgia",
+    # "georgia" is the US state; the country is tagged "asia-georgia" (prefix fallback)
     "germany": "europe/germany",
     "great-britain": "europe/great-britain",
     "greece": "europe/greece",
@@ -154,6 +227,72 @@ OTHER_REGIONS_TO_PATH = {
 }
 
 
+# Known partition ID patterns (from Geofabrik and Quadtree)
+PARTITION_PATTERNS = [
+    # Geofabrik-based
+    "norcal", "socal", "north", "south", "east", "west",
+    # Quadtree-based
+    "northeast", "northwest", "southeast", "southwest",
+    "ne", "nw", "se", "sw",
+    # Nested quadtree (e.g., ne_sw, southwest_ne)
+    r"[ns][ew]_[ns][ew]",
+    r"(northeast|northwest|southeast|southwest)_[ns][ew]",
+    # "other" catch-all
+    "other",
+]
+
+# Precompiled patterns for tags, filenames, release bodies and asset names
+_VERSION_RE = re.compile(r'\d+\.\d+\.\d+$')
+_CLIMB_COUNT_OLD_RE = re.compile(r'\*\*Climb Count:\*\*\s*([\d,]+)')
+_CLIMB_COUNT_NEW_RE = re.compile(r'\* Climbs:\s*([\d,]+)')
+_ELEVATION_ERRORS_RE = re.compile(r'\*\*Elevation Errors:\*\*\s*(\d+)')
+_LINK_PAGE_RE = re.compile(r'[?&]page=(\d+)')
+_PARTITION_RE = re.compile(
+    r'_(' + '|'.join(PARTITION_PATTERNS) + r')\.sqlite$', re.IGNORECASE
+)
+
+
+def _merge_region_tables(*tables: Dict[str, str]) -> Dict[str, str]:
+    """Merge region tables into a single lookup, refusing ambiguous tag names."""
+    merged = {}
+    for table in tables:
+        duplicates = merged.keys() & table.keys()
+        if duplicates:
+            raise ValueError(f"Region tags mapped more than once: {sorted(duplicates)}")
+        merged.update(table)
+    return merged
+
+
+# Single lookup table for all known release tag regions
+_REGION_TO_PATH = _merge_region_tables(
+    US_STATES_TO_PATH, EUROPE_COUNTRIES_TO_PATH, OTHER_REGIONS_TO_PATH
+)
+
+# Continent-prefix fallback: e.g. "canada-alberta" -> "north-america/canada/alberta",
+# "north-america-mexico" -> "north-america/mexico", "europe-france" -> "europe/france".
+# This catches tags that follow the "<continent-or-country>-<rest>" convention without
+# requiring every permutation to be hardcoded above.
+_CONTINENT_PREFIXES = {
+    "north-america": "north-america",
+    "south-america": "south-america",
+    "central-america": "central-america",
+    "europe": "europe",
+    "asia": "asia",
+    "africa": "africa",
+    "oceania": "oceania",
+    "antarctica": "antarctica",
+    # Country-level prefixes that nest under a continent
+    "canada": "north-america/canada",
+    "usa": "north-america/united-states-of-america",
+    "us": "north-america/united-states-of-america",
+    "france": "europe/france",
+    "germany": "europe/germany",
+    "italy": "europe/italy",
+    "spain": "europe/spain",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_region_path(tag_region: str) -> str:
     """
     Map a release tag region name to its full geographic path.
@@ -166,55 +305,57 @@ def get_region_path(tag_region: str) -> str:
     """
     tag_lower = tag_region.lower()
 
-    # Check US states first (most common)
-    if tag_lower in US_STATES_TO_PATH:
-        return US_STATES_TO_PATH[tag_lower]
-
-    # Check European countries
-    if tag_lower in EUROPE_COUNTRIES_TO_PATH:
-        return EUROPE_COUNTRIES_TO_PATH[tag_lower]
-
-    # Check other regions
-    if tag_lower in OTHER_REGIONS_TO_PATH:
-        return OTHER_REGIONS_TO_PATH[tag_lower]
-
-    # Continent-prefix fallback: e.g. "canada-alberta" -> "north-america/canada/alberta",
-    # "north-america-mexico" -> "north-america/mexico", "europe-france" -> "europe/france".
-    # This catches tags that follow the "<continent-or-country>-<rest>" convention without
-    # requiring every permutation to be hardcoded above.
-    continent_prefixes = {
-        "north-america": "north-america",
-        "south-america": "south-america",
-        "central-america": "central-america",
-        "europe": "europe",
-        "asia": "asia",
-        "africa": "africa",
-        "oceania": "oceania",
-        "antarctica": "antarctica",
-        # Country-level prefixes that nest under a continent
-        "canada": "north-america/canada",
-        "usa": "north-america/united-states-of-america",
-        "us": "north-america/united-states-of-america",
-        "france": "europe/france",
-        "germany": "europe/germany",
-        "italy": "europe/italy",
-        "spain": "europe/spain",
-    }
-    for prefix, path_root in continent_prefixes.items():
-        if tag_lower.startswith(prefix + "-"):
-            remainder = tag_lower[len(prefix) + 1:]
-            if remainder:
-                return f"{path_root}/{remainder}"
+    path = _REGION_TO_PATH.get(tag_lower)
+    if path:
+        return path
+
+    # Look up each "-"-delimited prefix directly instead of scanning every known
+    # prefix (no known prefix is itself a "-"-prefix of another, so at most one matches)
+    dash = tag_lower.find("-")
+    while dash != -1:
+        path_root = _CONTINENT_PREFIXES.get(tag_lower[:dash])
+        remainder = tag_lower[dash + 1:]
+        if path_root and remainder:
+            return f"{path_root}/{remainder}"
+        dash = tag_lower.find("-", dash + 1)
 
     # Default: return as-is if not found (for custom/unknown regions)
     return tag_lower
 
 
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
 def get_github_token() -> Optional[str]:
     """Get GitHub token from environment."""
     return os.environ.get("GITHUB_TOKEN")
 
 
+def get_github_tokens() -> List[str]:
+    """
+    Get all GitHub tokens from environment.
+
+    Reads a comma-separated GITHUB_TOKENS list, falling back to GITHUB_TOKEN.
+    """
+    tokens = [t.strip() for t in os.environ.get("GITHUB_TOKENS", "").split(",") if t.strip()]
+    if not tokens:
+        token = get_github_token()
+        if token:
+            tokens = [token]
+    return tokens
+
+
 def extract_region_from_tag(tag_name: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Extract region name and version from a release tag.
@@ -227,10 +368,13 @@ def extract_region_from_tag(tag_name: str) -> Tuple[Optional[str], Optional[str]
     Returns:
         Tuple of (region_name, version) or (None, None) if not a valid tag
     """
-    # Pattern: region-name-vX.Y.Z
-    match = re.match(r'^(.+?)-v(\d+\.\d+\.\d+)$', tag_name)
-    if match:
-        return match.group(1), match.group(2)
+    # Pattern: region-name-vX.Y.Z. The version never contains "-v", so splitting on
+    # the last "-v" and validating the version matches r'^(.+?)-v(\d+\.\d+\.\d+)$'.
+    region, sep, version = tag_name.rpartition("-v")
+    if sep and region:
+        match = _VERSION_RE.match(version)
+        if match:
+            return region, match.group(0)
     return None, None
 
 
@@ -243,9 +387,10 @@ def extract_region_from_filename(filename: str) -> Optional[str]:
         Hawaii_climbs_all-surfaces_all-access_imperial_2025-01-03_v2.2.0_e0000.xlsx -> Hawaii
         New_York_climbs_all_basic_2025-11-01_v2.1.0_e0000-1.xlsx -> New_York
     """
-    match = re.match(r'^(.+?)_climbs', filename)
-    if match:
-        return match.group(1)
+    # First "_climbs" after at least one character (same as r'^(.+?)_climbs')
+    index = filename.find("_climbs", 1)
+    if index > 0:
+        return filename[:index]
     return None
 
 
@@ -255,14 +400,18 @@ def extract_climb_count_from_release_body(body: str) -> Optional[int]:
 
     Handles both old format "**Climb Count:** 1,234" and new format "* Climbs: 1,234"
     """
+    # Substring checks are much cheaper than a regex search, so only run the
+    # regex when its marker text is present
     # Try old format first: **Climb Count:** 1,234
-    match = re.search(r'\*\*Climb Count:\*\*\s*([\d,]+)', body)
-    if match:
-        return int(match.group(1).replace(',', ''))
+    if "**Climb Count:**" in body:
+        match = _CLIMB_COUNT_OLD_RE.search(body)
+        if match:
+            return int(match.group(1).replace(',', ''))
     # Try new bulletized format: * Climbs: 1,234
-    match = re.search(r'\* Climbs:\s*([\d,]+)', body)
-    if match:
-        return int(match.group(1).replace(',', ''))
+    if "* Climbs:" in body:
+        match = _CLIMB_COUNT_NEW_RE.search(body)
+        if match:
+            return int(match.group(1).replace(',', ''))
     return None
 
 
@@ -272,12 +421,14 @@ def extract_elevation_errors_from_release_body(body: str) -> Optional[int]:
 
     Handles both old format "**Elevation Errors:** 0" and new format (not yet defined)
     """
-    match = re.search(r'\*\*Elevation Errors:\*\*\s*(\d+)', body)
-    if match:
-        return int(match.group(1))
+    if "**Elevation Errors:**" in body:
+        match = _ELEVATION_ERRORS_RE.search(body)
+        if match:
+            return int(match.group(1))
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _partition_id_to_display_name(partition_id: str) -> str:
     """
     Convert a partition ID to a human-readable display name.
@@ -340,23 +491,161 @@ def _partition_id_to_display_name(partition_id: str) -> str:
     return partition_id.replace("_", " ").title()
 
 
-def fetch_checksums(sha256_url: str, token: Optional[str] = None) -> Dict[str, str]:
+def _create_session() -> requests.Session:
+    """
+    Create the shared requests Session.
+
+    The connection pool is sized for concurrent page fetches so TCP/TLS
+    connections are reused, and transient 502/503/504 errors are retried.
+    Retry-After is ignored here so 403/429 rate limits reach _github_request,
+    which records them on the TokenPool and rotates tokens.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),  # GraphQL queries are read-only POSTs
+        raise_on_status=False,
+        # urllib3 would otherwise retry 413/429/503 on Retry-After with the same token
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers["Accept"] = "application/vnd.github.v3+json"
+    return session
+
+
+# Shared by all GitHub requests (and threads) for keep-alive connection reuse
+_SESSION = _create_session()
+
+
+class TokenPool:
+    """
+    Round-robin pool of GitHub tokens.
+
+    Each token is rate limited separately, so requests are spread across all
+    tokens. A token whose remaining budget drops to RATE_LIMIT_MIN_REMAINING is
+    skipped until its reset time. A pool of [None] sends unauthenticated requests.
+    """
+
+    def __init__(self, tokens: List[Optional[str]]):
+        self.tokens = list(tokens) or [None]
+        self._resume_at = {token: 0.0 for token in self.tokens}
+        self._cycle = itertools.cycle(self.tokens)
+        self._lock = threading.Lock()
+
+    @property
+    def authenticated(self) -> bool:
+        """True if the pool holds at least one real token."""
+        return any(self.tokens)
+
+    def acquire(self) -> Optional[str]:
+        """Get the next usable token, waiting for the earliest reset if all are exhausted."""
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self.tokens)):
+                token = next(self._cycle)
+                if self._resume_at[token] <= now:
+                    return token
+            token = min(self.tokens, key=self._resume_at.__getitem__)
+            delay = self._resume_at[token] - now
+
+        print(f"Rate limit nearly exhausted, waiting {delay:.0f}s for reset")
+        time.sleep(delay)
+        return token
+
+    def note_response(self, token: Optional[str], response: requests.Response):
+        """Take a token out of rotation until reset when X-RateLimit-Remaining hits the threshold."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None or int(remaining) > RATE_LIMIT_MIN_REMAINING:
+            return
+
+        reset = int(response.headers.get("X-RateLimit-Reset", "0"))
+        with self._lock:
+            self._resume_at[token] = max(self._resume_at[token], reset + 1.0)
+
+
+# Shared pools for callers that pass a single token (or None), so rate-limit
+# state is kept between calls
+_single_token_pools: Dict[Optional[str], TokenPool] = {}
+
+
+def _token_pool(token: Optional[Union[str, TokenPool]]) -> TokenPool:
+    """Get the TokenPool for a token argument (a single token, None, or a pool)."""
+    if isinstance(token, TokenPool):
+        return token
+    if token not in _single_token_pools:
+        _single_token_pools[token] = TokenPool([token])
+    return _single_token_pools[token]
+
+
+def _github_request(
+    method: str, url: str, token: Optional[Union[str, TokenPool]] = None,
+    auth_scheme: str = "token", **kwargs
+) -> requests.Response:
+    """
+    Send a GitHub request, respecting rate-limit headers.
+
+    A token is taken from the pool for each attempt and sent as
+    "Authorization: <auth_scheme> <token>". Tokens that are nearly exhausted are
+    skipped until reset (waiting if every token is exhausted), and rate-limited
+    responses (403/429 with Retry-After or no remaining budget) are retried up
+    to RATE_LIMIT_RETRIES times with exponential backoff.
+
+    Returns:
+        The last response received
+    """
+    pool = _token_pool(token)
+    base_headers = kwargs.pop("headers", None) or {}
+
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        current_token = pool.acquire()
+        headers = dict(base_headers)
+        if current_token:
+            headers["Authorization"] = f"{auth_scheme} {current_token}"
+
+        response = _SESSION.request(method, url, headers=headers, **kwargs)
+        pool.note_response(current_token, response)
+
+        if response.status_code not in (403, 429) or attempt == RATE_LIMIT_RETRIES:
+            return response
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = int(retry_after) * (2 ** attempt)
+            except ValueError:
+                delay = 60 * (2 ** attempt)
+            print(f"Rate limited (HTTP {response.status_code}), retrying in {delay}s")
+            time.sleep(delay)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            # Primary rate limit: the token is out of rotation until its reset
+            print(f"Rate limit exhausted (HTTP {response.status_code}), switching token or waiting for reset")
+        else:
+            # Not a rate limit (e.g. missing permissions): retrying will not help
+            return response
+
+    return response
+
+
+def fetch_checksums(
+    sha256_url: str, token: Optional[Union[str, TokenPool]] = None
+) -> Dict[str, str]:
     """
     Fetch and parse .sha256 checksum file from release assets.
 
     Args:
         sha256_url: URL to the .sha256 file
-        token: Optional GitHub token for authentication
+        token: Optional GitHub token (or TokenPool) for authentication
 
     Returns:
         Dict mapping filename to SHA256 checksum
     """
     headers = {"Accept": "application/octet-stream"}
-    if token:
-        headers["Authorization"] = f"token {token}"
 
     try:
-        response = requests.get(sha256_url, headers=headers, timeout=30)
+        response = _github_request("GET", sha256_url, token, headers=headers, timeout=30)
         if response.status_code == 200:
             checksums = {}
             for line in response.text.strip().split('\n'):
@@ -371,455 +660,652 @@ def fetch_checksums(sha256_url: str, token: Optional[str] = None) -> Dict[str, s
     return {}
 
 
-def fetch_partition_metadata(metadata_url: str, token: Optional[str] = None) -> Dict:
+def fetch_partition_metadata(
+    metadata_url: str, token: Optional[Union[str, TokenPool]] = None
+) -> Dict:
     """
     Fetch partition metadata JSON from release asset.
 
     Args:
         metadata_url: URL to .sqlite.metadata.json file
-        token: Optional GitHub token for authentication
+        token: Optional GitHub token (or TokenPool) for authentication
 
     Returns:
         Parsed metadata dict or empty dict on error
     """
     headers = {"Accept": "application/octet-stream"}
-    if token:
-        headers["Authorization"] = f"token {token}"
 
     try:
-        response = requests.get(metadata_url, headers=headers, timeout=30)
+        response = _github_request("GET", metadata_url, token, headers=headers, timeout=30)
         if response.status_code == 200:
-            return json.loads(response.text)
+            return _json_loads(response.content)
     except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
         print(f"  Warning: Could not fetch partition metadata: {e}")
 
     return {}
 
 
-def fetch_releases(owner: str, repo: str, token: Optional[str] = None) -> List[Dict]:
+def _parse_last_page(links: Dict) -> Optional[int]:
     """
-    Fetch all releases from a GitHub repository.
+    Get the last page number from a parsed GitHub Link header.
 
-    Args:
-        owner: Repository owner
-        repo: Repository name
-        token: Optional GitHub token for authentication
+    Returns:
+        Page number of rel="last", or None if the header does not provide it
+    """
+    last_url = links.get("last", {}).get("url", "")
+    match = _LINK_PAGE_RE.search(last_url)
+    if match:
+        return int(match.group(1))
+    return None
+
+
+def _release_cache_path(cache_key: str, page: int) -> str:
+    """Path of the cached copy of a releases page."""
+    return os.path.join(RELEASE_CACHE_DIR, f"{cache_key}_page_{page}.json")
+
+
+def _load_cached_page(cache_key: str, page: int) -> Dict:
+    """
+    Load a cached releases page.
+
+    Returns:
+        Dict with "etag", "releases" and "links" keys, or empty dict if not cached
+    """
+    try:
+        with open(_release_cache_path(cache_key, page), "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cached_page(cache_key: str, page: int, etag: str, releases: List[Dict], links: Dict):
+    """Store a releases page and its ETag so the next run can send If-None-Match."""
+    try:
+        os.makedirs(RELEASE_CACHE_DIR, exist_ok=True)
+        with open(_release_cache_path(cache_key, page), "wb") as f:
+            f.write(_json_dumps({"etag": etag, "releases": releases, "links": links}))
+    except OSError as e:
+        print(f"Warning: Could not write release cache for page {page}: {e}")
+
+
+def _fetch_release_page(
+    url: str, page: int, per_page: int, cache_key: str,
+    token: Optional[Union[str, TokenPool]] = None
+) -> Tuple[Optional[List[Dict]], Dict]:
+    """
+    Fetch a single page of releases.
+
+    Sends the cached ETag as If-None-Match; on HTTP 304 the cached page is
+    returned (304s do not count against the rate limit).
+
+    Returns:
+        Tuple of (page releases or None on error, parsed Link header)
+    """
+    params = {"per_page": per_page, "page": page}
+
+    headers = {}
+    cached = _load_cached_page(cache_key, page)
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    try:
+        response = _github_request(
+            "GET", url, token, headers=headers, params=params, timeout=60
+        )
+
+        if response.status_code == 304 and "releases" in cached:
+            return cached["releases"], cached.get("links", {})
+        if response.status_code == 200:
+            page_releases = _json_loads(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                _save_cached_page(cache_key, page, etag, page_releases, response.links)
+            return page_releases, response.links
+        print(f"Failed to fetch releases page {page}: HTTP {response.status_code}")
+
+    except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+        print(f"Network error fetching releases page {page}: {e}")
+
+    return None, {}
+
+
+def _fetch_releases_rest(
+    owner: str, repo: str, token: Optional[Union[str, TokenPool]] = None
+) -> List[Dict]:
+    """
+    Fetch all releases using the REST API.
+
+    The first page is fetched on its own to learn the page count from the Link
+    header; the remaining pages are then fetched concurrently. If the Link header
+    is missing, pages are fetched in bursts until a short page is returned.
+    Pages are cached with their ETag in RELEASE_CACHE_DIR for conditional requests.
 
     Returns:
         List of release data dicts
     """
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    if token:
-        headers["Authorization"] = f"token {token}"
+    url = f"https://api.github.com/repos/{owner}/{repo}/releases"
+    per_page = RELEASES_PER_PAGE
+    cache_key = f"{owner}_{repo}_{per_page}"
 
-    releases = []
-    page = 1
-    per_page = 100
+    def fetch_page(page: int) -> Optional[List[Dict]]:
+        return _fetch_release_page(url, page, per_page, cache_key, token)[0]
 
-    while True:
-        url = f"https://api.github.com/repos/{owner}/{repo}/releases"
-        params = {"per_page": per_page, "page": page}
+    first_page, links = _fetch_release_page(url, 1, per_page, cache_key, token)
+    if not first_page:
+        return []
 
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=60)
+    releases = list(first_page)
+    if len(first_page) < per_page:
+        return releases
+
+    last_page = _parse_last_page(links)
 
-            if response.status_code == 200:
-                page_releases = response.json()
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+        next_page = 2
+        while last_page is None or next_page <= last_page:
+            if last_page is not None:
+                # Page count is known: fetch all remaining pages at once
+                pages = range(next_page, last_page + 1)
+            else:
+                pages = range(next_page, next_page + PAGE_FETCH_WORKERS)
+
+            # Pages are consumed in order, stopping at the first failed/short page
+            for page_releases in executor.map(fetch_page, pages):
                 if not page_releases:
-                    break
+                    return releases
                 releases.extend(page_releases)
                 if len(page_releases) < per_page:
-                    break
-                page += 1
-            else:
-                print(f"Failed to fetch releases: HTTP {response.status_code}")
-                break
+                    return releases
 
+            next_page = pages[-1] + 1
+
+    return releases
+
+
+def _graphql_release_to_rest(node: Dict) -> Dict:
+    """Convert a GraphQL release node to the REST release shape used by scan_releases."""
+    assets = node.get("releaseAssets") or {}
+    return {
+        "tag_name": node.get("tagName") or "",
+        "html_url": node.get("url") or "",
+        "published_at": node.get("publishedAt"),
+        "body": node.get("description") or "",
+        "assets": [
+            {
+                "name": asset.get("name", ""),
+                "size": asset.get("size", 0),
+                "browser_download_url": asset.get("downloadUrl", ""),
+            }
+            for asset in assets.get("nodes") or []
+        ],
+    }
+
+
+def _fetch_releases_graphql(
+    owner: str, repo: str, token: Union[str, TokenPool]
+) -> Optional[List[Dict]]:
+    """
+    Fetch all releases using the GraphQL API, requesting only the fields we index.
+
+    Returns:
+        List of release data dicts (REST shape), or None if the query failed
+    """
+    releases = []
+    cursor = None
+
+    while True:
+        payload = {
+            "query": RELEASES_GRAPHQL_QUERY,
+            "variables": {"owner": owner, "name": repo, "cursor": cursor},
+        }
+
+        try:
+            response = _github_request(
+                "POST", GRAPHQL_URL, token, auth_scheme="bearer", json=payload, timeout=60
+            )
         except requests.exceptions.RequestException as e:
-            print(f"Network error fetching releases: {e}")
+            print(f"Network error fetching releases via GraphQL: {e}")
+            return None
+
+        if response.status_code != 200:
+            print(f"Failed to fetch releases via GraphQL: HTTP {response.status_code}")
+            return None
+
+        try:
+            data = _json_loads(response.content)
+        except json.JSONDecodeError as e:
+            print(f"Invalid GraphQL response fetching releases: {e}")
+            return None
+
+        if data.get("errors"):
+            print(f"GraphQL errors fetching releases: {data['errors']}")
+            return None
+
+        connection = ((data.get("data") or {}).get("repository") or {}).get("releases")
+        if not connection:
+            print("GraphQL response did not contain releases")
+            return None
+
+        for node in connection.get("nodes") or []:
+            if node.get("releaseAssets", {}).get("pageInfo", {}).get("hasNextPage"):
+                print(f"Warning: {node.get('tagName')} has more than "
+                      f"{RELEASE_ASSETS_PER_QUERY} assets; extra assets are not indexed")
+            releases.append(_graphql_release_to_rest(node))
+
+        page_info = connection.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
             break
+        cursor = page_info.get("endCursor")
 
     return releases
 
 
-def scan_releases(owner: str, repo: str, token: Optional[str] = None) -> Dict[str, Dict]:
+def fetch_releases(
+    owner: str, repo: str, token: Optional[Union[str, TokenPool]] = None
+) -> List[Dict]:
     """
-    Scan GitHub Releases for climb data files.
+    Fetch all releases from a GitHub repository.
+
+    Uses the GraphQL API when a token is available (GraphQL requires authentication),
+    falling back to the paginated REST API otherwise or if the GraphQL query fails.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        token: Optional GitHub token (or TokenPool) for authentication
 
     Returns:
-        Dictionary keyed by region name with file information
+        List of release data dicts
     """
-    releases = fetch_releases(owner, repo, token)
-    index_data = {}
+    if _token_pool(token).authenticated:
+        releases = _fetch_releases_graphql(owner, repo, token)
+        if releases is not None:
+            return releases
+        print("Falling back to REST API for releases")
 
-    for release in releases:
-        tag_name = release.get("tag_name", "")
-        region_from_tag, version = extract_region_from_tag(tag_name)
-
-        if not region_from_tag:
-            # Skip non-region releases (e.g., app version releases)
-            continue
-
-        # Get release metadata
-        release_url = release.get("html_url", "")
-        published_at = release.get("published_at", "")
-        release_body = release.get("body", "")
-
-        # Extract climb count and errors from release body
-        climb_count = extract_climb_count_from_release_body(release_body)
-        elevation_errors = extract_elevation_errors_from_release_body(release_body)
-
-        # Process assets
-        assets = release.get("assets", [])
-        xlsx_files = []
-        xlsx_sizes = []
-        xlsx_urls = []
-        sqlite_file = None
-        sqlite_size = 0
-        sqlite_url = None
-
-        # Split SQLite detection (binary chunks: .001, .002, etc.)
-        sqlite_split_files = []
-        sqlite_split_sizes = []
-        sqlite_split_urls = []
-        sha256_url = None
-
-        # Gzipped SQLite detection (.sqlite.gz single-file or .sqlite.gz.001/.002 split)
-        sqlite_gz_file = None
-        sqlite_gz_size = 0
-        sqlite_gz_url = None
-        sqlite_gz_split_files = []
-        sqlite_gz_split_sizes = []
-        sqlite_gz_split_urls = []
-        sqlite_gz_sha256_url = None
-
-        # Partitioned SQLite detection (geographic partitions: _norcal, _socal, _northeast, etc.)
-        sqlite_partition_files = []
-        sqlite_partition_sizes = []
-        sqlite_partition_urls = []
-        sqlite_partition_ids = []
-        partition_metadata_urls = {}  # partition_id -> metadata_url
-
-        region_name = None  # Will be extracted from filename
-
-        # Known partition ID patterns (from Geofabrik and Quadtree)
-        partition_patterns = [
-            # Geofabrik-based
-            "norcal", "socal", "north", "south", "east", "west",
-            # Quadtree-based
-            "northeast", "northwest", "southeast", "southwest",
-            "ne", "nw", "se", "sw",
-            # Nested quadtree (e.g., ne_sw, southwest_ne)
-            r"[ns][ew]_[ns][ew]",
-            r"(northeast|northwest|southeast|southwest)_[ns][ew]",
-            # "other" catch-all
-            "other",
-        ]
-        partition_regex = re.compile(
-            r'_(' + '|'.join(partition_patterns) + r')\.sqlite$', re.IGNORECASE
-        )
+    return _fetch_releases_rest(owner, repo, token)
 
-        for asset in assets:
-            name = asset.get("name", "")
-            size = asset.get("size", 0)
-            download_url = asset.get("browser_download_url", "")
 
-            if name.endswith(".xlsx"):
-                xlsx_files.append(name)
-                xlsx_sizes.append(size)
-                xlsx_urls.append(download_url)
+def _xlsx_sort_key(filename: str) -> Tuple[str, int]:
+    """
+    Sort key for xlsx assets: (base filename, part number).
 
-                # Extract region name from xlsx filename
-                if not region_name:
-                    region_name = extract_region_from_filename(name)
+    Split parts ("...-2.xlsx") sort under their base name in numeric order;
+    unsplit files sort as part 0.
+    """
+    if filename.endswith(".xlsx"):
+        base, sep, part = filename[:-len(".xlsx")].rpartition("-")
+        if sep and part.isdecimal():
+            return base + ".xlsx", int(part)
+    return filename, 0
 
-            elif re.match(r'.*\.sqlite\.gz\.\d{3}$', name):
-                # Split gzipped SQLite chunk (.sqlite.gz.001, .sqlite.gz.002, ...)
-                sqlite_gz_split_files.append(name)
-                sqlite_gz_split_sizes.append(size)
-                sqlite_gz_split_urls.append(download_url)
-                if not region_name:
-                    # Remove ".001" to get ".sqlite.gz", then back to base name
-                    base_name = name.rsplit('.', 1)[0].replace('.gz', '')
-                    region_name = extract_region_from_filename(base_name)
 
-            elif name.endswith(".sqlite.gz"):
-                # Single-file gzipped SQLite (not split)
-                sqlite_gz_file = name
-                sqlite_gz_size = size
-                sqlite_gz_url = download_url
-                if not region_name:
-                    base_name = name[:-len('.gz')]  # strip ".gz" -> ".sqlite"
-                    region_name = extract_region_from_filename(base_name)
+def _is_chunk_name(name: str, base_suffix: str) -> bool:
+    """True if name is a numbered chunk of a base_suffix file (e.g. "x.sqlite.001" for ".sqlite")."""
+    return (
+        name[-4:-3] == "."
+        and name[-3:].isdecimal()
+        and name[:-4].endswith(base_suffix)
+    )
 
-            elif name.endswith(".sqlite.gz.sha256"):
-                # Checksum file for split gzipped SQLite
-                sqlite_gz_sha256_url = download_url
 
-            elif re.match(r'.*\.sqlite\.\d{3}$', name):
-                # Split SQLite chunk (.sqlite.001, .sqlite.002, etc.)
-                sqlite_split_files.append(name)
-                sqlite_split_sizes.append(size)
-                sqlite_split_urls.append(download_url)
+def _asset_columns(assets: List[Tuple], width: int) -> Tuple[List, ...]:
+    """Split a list of asset tuples into `width` parallel lists (empty lists if no assets)."""
+    if not assets:
+        return tuple([] for _ in range(width))
+    return tuple(list(column) for column in zip(*assets))
 
-                # Extract region name from sqlite filename if not yet found
+
+def process_release(
+    release: Dict, token: Optional[Union[str, TokenPool]] = None
+) -> Optional[Tuple[str, Dict]]:
+    """
+    Build the index entry for a single release.
+
+    Returns:
+        Tuple of (region path key, region entry), or None if the release is not
+        a region release or has no climb data files
+    """
+    # Skip non-region releases (e.g., app version releases) before any other work
+    tag_name = release.get("tag_name", "")
+    region_from_tag, version = extract_region_from_tag(tag_name)
+    if not region_from_tag:
+        return None
+
+    # Get release metadata
+    release_url = release.get("html_url", "")
+    published_at = release.get("published_at", "")
+    release_body = release.get("body") or ""  # REST returns null for empty bodies
+
+    # Extract climb count and errors from release body
+    climb_count = extract_climb_count_from_release_body(release_body)
+    elevation_errors = extract_elevation_errors_from_release_body(release_body)
+
+    # Process assets. Multi-file assets are collected as (name, size, url) tuples
+    # and split into parallel lists once sorted.
+    assets = release.get("assets", [])
+    xlsx_assets = []
+    sqlite_file = None
+    sqlite_size = 0
+    sqlite_url = None
+
+    # Split SQLite detection (binary chunks: .001, .002, etc.)
+    sqlite_split_assets = []
+    sha256_url = None
+
+    # Gzipped SQLite detection (.sqlite.gz single-file or .sqlite.gz.001/.002 split)
+    sqlite_gz_file = None
+    sqlite_gz_size = 0
+    sqlite_gz_url = None
+    sqlite_gz_split_assets = []
+    sqlite_gz_sha256_url = None
+
+    # Partitioned SQLite detection (geographic partitions: _norcal, _socal, _northeast, etc.)
+    # Tuples are (partition_id, name, size, url)
+    sqlite_partition_assets = []
+    partition_metadata_urls = {}  # partition_id -> metadata_url
+
+    region_name = None  # Will be extracted from filename
+
+    for asset in assets:
+        name = asset.get("name", "")
+        size = asset.get("size", 0)
+        download_url = asset.get("browser_download_url", "")
+
+        if name.endswith(".xlsx"):
+            xlsx_assets.append((name, size, download_url))
+
+            # Extract region name from xlsx filename
+            if not region_name:
+                region_name = extract_region_from_filename(name)
+
+        elif _is_chunk_name(name, ".sqlite.gz"):
+            # Split gzipped SQLite chunk (.sqlite.gz.001, .sqlite.gz.002, ...)
+            sqlite_gz_split_assets.append((name, size, download_url))
+            if not region_name:
+                # Remove ".001" to get ".sqlite.gz", then back to base name
+                base_name = name.rsplit('.', 1)[0].replace('.gz', '')
+                region_name = extract_region_from_filename(base_name)
+
+        elif name.endswith(".sqlite.gz"):
+            # Single-file gzipped SQLite (not split)
+            sqlite_gz_file = name
+            sqlite_gz_size = size
+            sqlite_gz_url = download_url
+            if not region_name:
+                base_name = name[:-len('.gz')]  # strip ".gz" -> ".sqlite"
+                region_name = extract_region_from_filename(base_name)
+
+        elif name.endswith(".sqlite.gz.sha256"):
+            # Checksum file for split gzipped SQLite
+            sqlite_gz_sha256_url = download_url
+
+        elif _is_chunk_name(name, ".sqlite"):
+            # Split SQLite chunk (.sqlite.001, .sqlite.002, etc.)
+            sqlite_split_assets.append((name, size, download_url))
+
+            # Extract region name from sqlite filename if not yet found
+            if not region_name:
+                # Remove the .001 suffix to get the base name
+                base_name = name.rsplit('.', 1)[0]  # e.g., California_climbs_....sqlite
+                region_name = extract_region_from_filename(base_name)
+
+        elif name.endswith(".sqlite.sha256"):
+            # Checksum file for split SQLite
+            sha256_url = download_url
+
+        elif name.endswith(".sqlite.metadata.json"):
+            # Partition metadata file
+            # e.g., "California_climbs_..._norcal.sqlite.metadata.json" -> "norcal"
+            base = name.replace(".sqlite.metadata.json", "")
+            partition_match = _PARTITION_RE.search(base + ".sqlite")
+            if partition_match:
+                part_id = partition_match.group(1).lower()
+                partition_metadata_urls[part_id] = download_url
+
+        elif name.endswith(".sqlite"):
+            # Check if this is a partitioned file
+            partition_match = _PARTITION_RE.search(name)
+            if partition_match:
+                partition_id = partition_match.group(1).lower()
+                sqlite_partition_assets.append((partition_id, name, size, download_url))
+
+                # Extract region name from partition filename if not yet found
                 if not region_name:
-                    # Remove the .001 suffix to get the base name
-                    base_name = name.rsplit('.', 1)[0]  # e.g., California_climbs_....sqlite
+                    # Remove the partition suffix to get base region name
+                    base_name = _PARTITION_RE.sub('.sqlite', name)
                     region_name = extract_region_from_filename(base_name)
+            else:
+                # Regular single SQLite file
+                sqlite_file = name
+                sqlite_size = size
+                sqlite_url = download_url
 
-            elif name.endswith(".sqlite.sha256"):
-                # Checksum file for split SQLite
-                sha256_url = download_url
-
-            elif name.endswith(".sqlite.metadata.json"):
-                # Partition metadata file
-                # e.g., "California_climbs_..._norcal.sqlite.metadata.json" -> "norcal"
-                base = name.replace(".sqlite.metadata.json", "")
-                partition_match = partition_regex.search(base + ".sqlite")
-                if partition_match:
-                    part_id = partition_match.group(1).lower()
-                    partition_metadata_urls[part_id] = download_url
-
-            elif name.endswith(".sqlite"):
-                # Check if this is a partitioned file
-                partition_match = partition_regex.search(name)
-                if partition_match:
-                    partition_id = partition_match.group(1).lower()
-                    sqlite_partition_files.append(name)
-                    sqlite_partition_sizes.append(size)
-                    sqlite_partition_urls.append(download_url)
-                    sqlite_partition_ids.append(partition_id)
-
-                    # Extract region name from partition filename if not yet found
-                    if not region_name:
-                        # Remove the partition suffix to get base region name
-                        base_name = partition_regex.sub('.sqlite', name)
-                        region_name = extract_region_from_filename(base_name)
-                else:
-                    # Regular single SQLite file
-                    sqlite_file = name
-                    sqlite_size = size
-                    sqlite_url = download_url
-
-                    # Extract region name from sqlite filename if not yet found
-                    if not region_name:
-                        region_name = extract_region_from_filename(name)
-
-        # Determine if SQLite is split or partitioned
-        is_split_db = len(sqlite_split_files) > 0
-        is_partitioned_db = len(sqlite_partition_files) > 0
-
-        # Skip if no files found
-        if not xlsx_files and not sqlite_file and not sqlite_split_files and not sqlite_partition_files:
-            continue
-
-        # Use tag-based region name if filename extraction failed
-        if not region_name:
-            region_name = region_from_tag.replace("-", "_").title()
-
-        # Sort xlsx files for consistent ordering (handles split files)
-        if xlsx_files:
-            sorted_indices = sorted(
-                range(len(xlsx_files)),
-                key=lambda i: (
-                    xlsx_files[i].replace("-1.xlsx", ".xlsx").replace("-2.xlsx", ".xlsx"),
-                    0 if not re.search(r'-(\d+)\.xlsx$', xlsx_files[i]) else int(re.search(r'-(\d+)\.xlsx$', xlsx_files[i]).group(1))
+                # Extract region name from sqlite filename if not yet found
+                if not region_name:
+                    region_name = extract_region_from_filename(name)
+
+    # Determine if SQLite is split or partitioned
+    is_split_db = len(sqlite_split_assets) > 0
+    is_partitioned_db = len(sqlite_partition_assets) > 0
+
+    # Skip if no files found
+    if not xlsx_assets and not sqlite_file and not sqlite_split_assets and not sqlite_partition_assets:
+        return None
+
+    # Use tag-based region name if filename extraction failed
+    if not region_name:
+        region_name = region_from_tag.replace("-", "_").title()
+
+    # Sort for consistent ordering, then split into parallel name/size/url lists:
+    # xlsx by base name and part number, split chunks by name (.001, .002, ...),
+    # partitions alphabetically by partition_id (sorts are stable)
+    xlsx_assets.sort(key=lambda asset: _xlsx_sort_key(asset[0]))
+    sqlite_split_assets.sort(key=itemgetter(0))
+    sqlite_gz_split_assets.sort(key=itemgetter(0))
+    sqlite_partition_assets.sort(key=itemgetter(0))
+
+    xlsx_files, xlsx_sizes, xlsx_urls = _asset_columns(xlsx_assets, 3)
+    sqlite_split_files, sqlite_split_sizes, sqlite_split_urls = _asset_columns(sqlite_split_assets, 3)
+    sqlite_gz_split_files, sqlite_gz_split_sizes, sqlite_gz_split_urls = _asset_columns(
+        sqlite_gz_split_assets, 3
+    )
+    (sqlite_partition_ids, sqlite_partition_files,
+     sqlite_partition_sizes, sqlite_partition_urls) = _asset_columns(sqlite_partition_assets, 4)
+
+    is_split_gz = len(sqlite_gz_split_files) > 0
+    has_gz = sqlite_gz_file is not None or is_split_gz
+
+    partitions_data = []
+    if sqlite_partition_files:
+        # Build partition info for each partition
+        for i, partition_id in enumerate(sqlite_partition_ids):
+            # Generate display name from partition_id
+            display_name = _partition_id_to_display_name(partition_id)
+
+            # Fetch metadata if available
+            metadata = {}
+            if partition_id in partition_metadata_urls:
+                metadata = fetch_partition_metadata(
+                    partition_metadata_urls[partition_id], token
                 )
-            )
-            xlsx_files = [xlsx_files[i] for i in sorted_indices]
-            xlsx_sizes = [xlsx_sizes[i] for i in sorted_indices]
-            xlsx_urls = [xlsx_urls[i] for i in sorted_indices]
-
-        # Sort split SQLite files for consistent ordering (.001, .002, .003, etc.)
-        if sqlite_split_files:
-            sorted_indices = sorted(
-                range(len(sqlite_split_files)),
-                key=lambda i: sqlite_split_files[i]
-            )
-            sqlite_split_files = [sqlite_split_files[i] for i in sorted_indices]
-            sqlite_split_sizes = [sqlite_split_sizes[i] for i in sorted_indices]
-            sqlite_split_urls = [sqlite_split_urls[i] for i in sorted_indices]
-
-        # Sort split gzipped SQLite chunks (.gz.001, .gz.002, ...)
-        if sqlite_gz_split_files:
-            sorted_indices = sorted(
-                range(len(sqlite_gz_split_files)),
-                key=lambda i: sqlite_gz_split_files[i]
-            )
-            sqlite_gz_split_files = [sqlite_gz_split_files[i] for i in sorted_indices]
-            sqlite_gz_split_sizes = [sqlite_gz_split_sizes[i] for i in sorted_indices]
-            sqlite_gz_split_urls = [sqlite_gz_split_urls[i] for i in sorted_indices]
-
-        is_split_gz = len(sqlite_gz_split_files) > 0
-        has_gz = sqlite_gz_file is not None or is_split_gz
-
-        # Sort partitioned SQLite files for consistent ordering (alphabetically by partition_id)
-        partitions_data = []
-        if sqlite_partition_files:
-            sorted_indices = sorted(
-                range(len(sqlite_partition_files)),
-                key=lambda i: sqlite_partition_ids[i]
-            )
-            sqlite_partition_files = [sqlite_partition_files[i] for i in sorted_indices]
-            sqlite_partition_sizes = [sqlite_partition_sizes[i] for i in sorted_indices]
-            sqlite_partition_urls = [sqlite_partition_urls[i] for i in sorted_indices]
-            sqlite_partition_ids = [sqlite_partition_ids[i] for i in sorted_indices]
-
-            # Build partition info for each partition
-            for i, partition_id in enumerate(sqlite_partition_ids):
-                # Generate display name from partition_id
-                display_name = _partition_id_to_display_name(partition_id)
-
-                # Fetch metadata if available
-                metadata = {}
-                if partition_id in partition_metadata_urls:
-                    metadata = fetch_partition_metadata(
-                        partition_metadata_urls[partition_id], token
-                    )
-
-                # Extract bounds from metadata
-                bounds_data = None
-                if metadata.get("bounds"):
-                    b = metadata["bounds"]
-                    bounds_data = {
-                        "minLat": b.get("min_lat"),
-                        "minLon": b.get("min_lon"),
-                        "maxLat": b.get("max_lat"),
-                        "maxLon": b.get("max_lon"),
-                    }
-
-                partitions_data.append({
-                    "partition_id": partition_id,
-                    "display_name": display_name,
-                    "database_file": sqlite_partition_files[i],
-                    "database_size": sqlite_partition_sizes[i],
-                    "database_url": sqlite_partition_urls[i],
-                    "database_sha256": metadata.get("sha256"),
-                    "bounds": bounds_data,
-                    "climb_count": metadata.get("climb_count"),
-                    "size_mb": metadata.get("file_size_mb") or round(sqlite_partition_sizes[i] / (1024**2), 1),
-                    "metadata_available": bool(metadata),
-                })
-
-        # Fetch checksums if split database and checksum file exists
-        split_checksums = []
-        if is_split_db and sha256_url:
-            checksums_dict = fetch_checksums(sha256_url, token)
-            # Build ordered list of checksums matching split_files order
-            for filename in sqlite_split_files:
-                split_checksums.append(checksums_dict.get(filename, ""))
-
-        # Build region entry using path-based key (e.g., "north-america/us/hawaii")
-        region_key = get_region_path(region_from_tag)
-
-        # Determine if this is a split file set
-        has_split_files = len(xlsx_files) > 1
-
-        # Extract last_updated date from published_at
-        last_updated = published_at[:10] if published_at else None
-
-        # Determine partition type if partitioned
-        partition_type = None
-        if is_partitioned_db:
-            # Check if using Geofabrik names (norcal, socal) or Quadtree names (northeast, etc.)
-            geofabrik_ids = {"norcal", "socal", "north", "south", "east", "west"}
-            if any(pid in geofabrik_ids for pid in sqlite_partition_ids):
-                partition_type = "geofabrik"
-            else:
-                partition_type = "quadtree"
-
-        # Use flattened structure for iOS compatibility
-        index_data[region_key] = {
-            "region_name": region_name.replace("_", " "),
-            "version": version,
-            "release_tag": tag_name,
-            "release_url": release_url,
-            "climb_count": climb_count,
-            "elevation_errors": elevation_errors,
-            # Flattened xlsx fields (no nested object)
-            "files": xlsx_files,
-            "download_urls": xlsx_urls,
-            "file_sizes": xlsx_sizes,
-            "total_size": sum(xlsx_sizes),
-            "file_count": len(xlsx_files),
-            "has_split_files": has_split_files,
-            # Database fields - always populated when SQLite exists
-            # For split databases: logical name/total size, download via split_urls
-            "database_file": (
-                sqlite_file if sqlite_file
-                else sqlite_split_files[0].rsplit('.', 1)[0] if sqlite_split_files  # e.g., .sqlite.001 -> .sqlite
-                else None
-            ),
-            "database_size": (
-                sqlite_size if sqlite_size
-                else sum(sqlite_split_sizes) if sqlite_split_sizes
-                else None
-            ),
-            "database_url": (
-                sqlite_url if sqlite_url
-                else sqlite_split_urls[0] if sqlite_split_urls  # First chunk URL as reference
-                else None
-            ),
-            # Split database fields (binary chunks - iOS-expected schema)
-            "is_split": is_split_db,
-            "split_files": sqlite_split_files if is_split_db else None,
-            "split_urls": sqlite_split_urls if is_split_db else None,
-            "split_sizes": sqlite_split_sizes if is_split_db else None,
-            "split_checksums": split_checksums if is_split_db and split_checksums else None,
-            # Partitioned database fields (geographic partitions)
-            "is_partitioned": is_partitioned_db,
-            "partition_type": partition_type,
-            "partitions": partitions_data if is_partitioned_db else None,
-            "total_database_size": (
-                sum(sqlite_partition_sizes) if is_partitioned_db
-                else sum(sqlite_split_sizes) if is_split_db
-                else sqlite_size if sqlite_size
-                else None
-            ),
-            # Gzipped database fields (preferred format - ~3x smaller downloads).
-            # When present, the iOS app should prefer these over the raw sqlite path.
-            # - database_format: "gzip" if a .sqlite.gz is available, else "sqlite"
-            # - database_gz_url: single-file download URL (null if split across chunks)
-            # - database_gz_size: total compressed size on disk
-            # - database_decompressed_size: size after decompression (matches raw sqlite size)
-            # - is_gz_split: true when .sqlite.gz exceeds 2 GB and is split into .gz.00N
-            # - gz_split_files/gz_split_urls/gz_split_sizes: chunks to download+concat
-            "database_format": "gzip" if has_gz else ("sqlite" if (sqlite_file or is_split_db) else None),
-            "database_gz_file": (
-                sqlite_gz_file if sqlite_gz_file
-                else (sqlite_gz_split_files[0].rsplit('.', 1)[0] if sqlite_gz_split_files else None)
-            ),
-            "database_gz_size": (
-                sqlite_gz_size if sqlite_gz_size
-                else (sum(sqlite_gz_split_sizes) if sqlite_gz_split_sizes else None)
-            ),
-            "database_gz_url": sqlite_gz_url if sqlite_gz_file else None,
-            "database_decompressed_size": (
-                sqlite_size if sqlite_size
-                else (sum(sqlite_split_sizes) if sqlite_split_sizes else None)
-            ),
-            "is_gz_split": is_split_gz,
-            "gz_split_files": sqlite_gz_split_files if is_split_gz else None,
-            "gz_split_urls": sqlite_gz_split_urls if is_split_gz else None,
-            "gz_split_sizes": sqlite_gz_split_sizes if is_split_gz else None,
-            # Dates
-            "published_at": published_at,
-            "last_updated": last_updated,
-        }
+
+            # Extract bounds from metadata
+            bounds_data = None
+            if metadata.get("bounds"):
+                b = metadata["bounds"]
+                bounds_data = {
+                    "minLat": b.get("min_lat"),
+                    "minLon": b.get("min_lon"),
+                    "maxLat": b.get("max_lat"),
+                    "maxLon": b.get("max_lon"),
+                }
+
+            partitions_data.append({
+                "partition_id": partition_id,
+                "display_name": display_name,
+                "database_file": sqlite_partition_files[i],
+                "database_size": sqlite_partition_sizes[i],
+                "database_url": sqlite_partition_urls[i],
+                "database_sha256": metadata.get("sha256"),
+                "bounds": bounds_data,
+                "climb_count": metadata.get("climb_count"),
+                "size_mb": metadata.get("file_size_mb") or round(sqlite_partition_sizes[i] / (1024**2), 1),
+                "metadata_available": bool(metadata),
+            })
+
+    # Fetch checksums if split database and checksum file exists
+    split_checksums = []
+    if is_split_db and sha256_url:
+        checksums_dict = fetch_checksums(sha256_url, token)
+        # Build ordered list of checksums matching split_files order
+        for filename in sqlite_split_files:
+            split_checksums.append(checksums_dict.get(filename, ""))
+
+    # Build region entry using path-based key (e.g., "north-america/us/hawaii")
+    region_key = get_region_path(region_from_tag)
+
+    # Determine if this is a split file set
+    has_split_files = len(xlsx_files) > 1
+
+    # Totals reused by several fields below
+    xlsx_total_size = sum(xlsx_sizes)
+    sqlite_split_total_size = sum(sqlite_split_sizes)
+    sqlite_gz_split_total_size = sum(sqlite_gz_split_sizes)
+
+    # Extract last_updated date from published_at
+    last_updated = published_at[:10] if published_at else None
+
+    # Determine partition type if partitioned
+    partition_type = None
+    if is_partitioned_db:
+        # Check if using Geofabrik names (norcal, socal) or Quadtree names (northeast, etc.)
+        geofabrik_ids = {"norcal", "socal", "north", "south", "east", "west"}
+        if any(pid in geofabrik_ids for pid in sqlite_partition_ids):
+            partition_type = "geofabrik"
+        else:
+            partition_type = "quadtree"
+
+    # Use flattened structure for iOS compatibility
+    return region_key, {
+        "region_name": region_name.replace("_", " "),
+        "version": version,
+        "release_tag": tag_name,
+        "release_url": release_url,
+        "climb_count": climb_count,
+        "elevation_errors": elevation_errors,
+        # Flattened xlsx fields (no nested object)
+        "files": xlsx_files,
+        "download_urls": xlsx_urls,
+        "file_sizes": xlsx_sizes,
+        "total_size": xlsx_total_size,
+        "file_count": len(xlsx_files),
+        "has_split_files": has_split_files,
+        # Database fields - always populated when SQLite exists
+        # For split databases: logical name/total size, download via split_urls
+        "database_file": (
+            sqlite_file if sqlite_file
+            else sqlite_split_files[0].rsplit('.', 1)[0] if sqlite_split_files  # e.g., .sqlite.001 -> .sqlite
+            else None
+        ),
+        "database_size": (
+            sqlite_size if sqlite_size
+            else sqlite_split_total_size if sqlite_split_sizes
+            else None
+        ),
+        "database_url": (
+            sqlite_url if sqlite_url
+            else sqlite_split_urls[0] if sqlite_split_urls  # First chunk URL as reference
+            else None
+        ),
+        # Split database fields (binary chunks - iOS-expected schema)
+        "is_split": is_split_db,
+        "split_files": sqlite_split_files if is_split_db else None,
+        "split_urls": sqlite_split_urls if is_split_db else None,
+        "split_sizes": sqlite_split_sizes if is_split_db else None,
+        "split_checksums": split_checksums if is_split_db and split_checksums else None,
+        # Partitioned database fields (geographic partitions)
+        "is_partitioned": is_partitioned_db,
+        "partition_type": partition_type,
+        "partitions": partitions_data if is_partitioned_db else None,
+        "total_database_size": (
+            sum(sqlite_partition_sizes) if is_partitioned_db
+            else sqlite_split_total_size if is_split_db
+            else sqlite_size if sqlite_size
+            else None
+        ),
+        # Gzipped database fields (preferred format - ~3x smaller downloads).
+        # When present, the iOS app should prefer these over the raw sqlite path.
+        # - database_format: "gzip" if a .sqlite.gz is available, else "sqlite"
+        # - database_gz_url: single-file download URL (null if split across chunks)
+        # - database_gz_size: total compressed size on disk
+        # - database_decompressed_size: size after decompression (matches raw sqlite size)
+        # - is_gz_split: true when .sqlite.gz exceeds 2 GB and is split into .gz.00N
+        # - gz_split_files/gz_split_urls/gz_split_sizes: chunks to download+concat
+        "database_format": "gzip" if has_gz else ("sqlite" if (sqlite_file or is_split_db) else None),
+        "database_gz_file": (
+            sqlite_gz_file if sqlite_gz_file
+            else (sqlite_gz_split_files[0].rsplit('.', 1)[0] if sqlite_gz_split_files else None)
+        ),
+        "database_gz_size": (
+            sqlite_gz_size if sqlite_gz_size
+            else (sqlite_gz_split_total_size if sqlite_gz_split_sizes else None)
+        ),
+        "database_gz_url": sqlite_gz_url if sqlite_gz_file else None,
+        "database_decompressed_size": (
+            sqlite_size if sqlite_size
+            else (sqlite_split_total_size if sqlite_split_sizes else None)
+        ),
+        "is_gz_split": is_split_gz,
+        "gz_split_files": sqlite_gz_split_files if is_split_gz else None,
+        "gz_split_urls": sqlite_gz_split_urls if is_split_gz else None,
+        "gz_split_sizes": sqlite_gz_split_sizes if is_split_gz else None,
+        # Dates
+        "published_at": published_at,
+        "last_updated": last_updated,
+    }
+
+
+def scan_releases(
+    owner: str, repo: str, token: Optional[Union[str, TokenPool]] = None
+) -> Dict[str, Dict]:
+    """
+    Scan GitHub Releases for climb data files.
+
+    Releases are processed concurrently (partition metadata and checksum downloads
+    dominate per-release time) and merged in release order, so a later release for
+    the same region overwrites an earlier one exactly as a sequential scan would.
+
+    Returns:
+        Dictionary keyed by region name with file information
+    """
+    releases = fetch_releases(owner, repo, token)
+    index_data = {}
+
+    with ThreadPoolExecutor(max_workers=RELEASE_PROCESS_WORKERS) as executor:
+        for result in executor.map(functools.partial(process_release, token=token), releases):
+            if result:
+                region_key, region_entry = result
+                index_data[region_key] = region_entry
 
     return index_data
 
 
 def create_summary_stats(index_data: Dict) -> Dict:
-    """Create summary statistics for the index."""
-    total_regions = len(index_data)
-    total_xlsx_files = sum(region.get("file_count", 0) for region in index_data.values())
-
-    # Count SQLite databases (single file, split, or partitioned)
+    """Create summary statistics for the index in a single pass over the regions."""
+    total_xlsx_files = 0
+    total_xlsx_size = 0
     total_sqlite_files = 0
+    total_sqlite_size = 0
     total_partitioned_regions = 0
+    total_climbs = 0
+
     for region in index_data.values():
+        total_xlsx_files += region.get("file_count", 0)
+        total_xlsx_size += region.get("total_size", 0)
+        total_climbs += region.get("climb_count") or 0
+
+        # Count SQLite databases (single file, split, or partitioned)
         if region.get("is_partitioned") and region.get("partitions"):
             total_sqlite_files += len(region["partitions"])
             total_partitioned_regions += 1
@@ -828,11 +1314,7 @@ def create_summary_stats(index_data: Dict) -> Dict:
         elif region.get("database_file"):
             total_sqlite_files += 1
 
-    total_xlsx_size = sum(region.get("total_size", 0) for region in index_data.values())
-
-    # Calculate SQLite size (single file, split files, or partitioned files)
-    total_sqlite_size = 0
-    for region in index_data.values():
+        # Calculate SQLite size (single file, split files, or partitioned files)
         if region.get("is_partitioned") and region.get("total_database_size"):
             total_sqlite_size += region["total_database_size"]
         elif region.get("is_split") and region.get("split_sizes"):
@@ -840,10 +1322,8 @@ def create_summary_stats(index_data: Dict) -> Dict:
         elif region.get("database_size"):
             total_sqlite_size += region["database_size"]
 
-    total_climbs = sum(region.get("climb_count") or 0 for region in index_data.values())
-
     return {
-        "total_regions": total_regions,
+        "total_regions": len(index_data),
         "total_xlsx_files": total_xlsx_files,
         "total_sqlite_files": total_sqlite_files,
         "total_partitioned_regions": total_partitioned_regions,
@@ -854,6 +1334,40 @@ def create_summary_stats(index_data: Dict) -> Dict:
     }
 
 
+@contextmanager
+def _atomic_write(output_path: str):
+    """
+    Open a temporary file for binary writing and move it over output_path on success.
+
+    A failed or interrupted run leaves the previous file intact instead of a
+    half-written one.
+    """
+    tmp_path = output_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            yield f
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def write_regions_ndjson(index_data: Dict, output_path: str):
+    """
+    Write the regions map as newline-delimited JSON.
+
+    Each line is one region object with its path key added as "key", so clients
+    can stream-parse regions without loading the whole index.
+    """
+    # Encode every line first and write the file in one call
+    payload = b"".join(
+        _json_dumps({"key": region_key, **region_data}) + b"\n"
+        for region_key, region_data in index_data.items()
+    )
+    with _atomic_write(output_path) as f:
+        f.write(payload)
+
+
 def main():
     """Main function to run the indexer."""
     print("Starting release indexing...")
@@ -861,9 +1375,12 @@ def main():
     # Get repository info from environment or use defaults
     repo_name = os.environ.get("REPO_NAME", "stevehollx/global-road-and-trail-climbs")
     owner, repo = repo_name.split("/")
-    token = get_github_token()
+    tokens = get_github_tokens()
+    token = TokenPool(tokens)
 
-    if token:
+    if len(tokens) > 1:
+        print(f"Using authenticated GitHub API access ({len(tokens)} tokens)")
+    elif tokens:
         print(f"Using authenticated GitHub API access")
     else:
         print(f"Using unauthenticated API access (rate limited)")
@@ -875,18 +1392,37 @@ def main():
     # Create the final index structure
     final_index = {
         "version": "2.0.0",
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
         "repository": repo_name,
         "summary": create_summary_stats(index_data),
+        "regions_file": REGIONS_NDJSON_PATH,
         "regions": index_data,
     }
 
     # Write to index.json in the current directory
     output_path = "index.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(final_index, f, indent=2, ensure_ascii=False)
+    payload = _json_dumps(final_index, indent=True)
+    with _atomic_write(output_path) as f:
+        f.write(payload)
+
+    # Compressed copy for serving with Content-Encoding (skipped if zstandard is not installed)
+    if zstandard is not None:
+        with _atomic_write(output_path + ".zst") as f:
+            f.write(zstandard.ZstdCompressor(level=INDEX_ZSTD_LEVEL).compress(payload))
+    else:
+        print(f"zstandard not installed, skipping {output_path}.zst")
+
+    # Same regions, one per line, for streaming clients
+    write_regions_ndjson(index_data, REGIONS_NDJSON_PATH)
+
+    # Binary copy of the full index (skipped if msgpack is not installed)
+    if msgpack is not None:
+        with _atomic_write(INDEX_MSGPACK_PATH) as f:
+            f.write(msgpack.packb(final_index, use_bin_type=True))
+    else:
+        print(f"msgpack not installed, skipping {INDEX_MSGPACK_PATH}")
 
-    print(f"\n✓ Index created successfully at {output_path}")
+    print(f"\n✓ Index created successfully at {output_path} (+ {REGIONS_NDJSON_PATH})")
     print(f"  - Found {final_index['summary']['total_regions']} regions")
     print(f"  - Total XLSX files: {final_index['summary']['total_xlsx_files']}")
     print(f"  - Total SQLite files: {final_index['summary']['total_sqlite_files']}")